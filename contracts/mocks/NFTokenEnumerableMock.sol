@@ -24,6 +24,21 @@ contract NFTokenEnumerableMock is
     super._mint(_to, _tokenId);
   }
 
+  /**
+   * @dev Mints multiple new NFTs.
+   * @param _to The address that will own the minted NFTs.
+   * @param _tokenIds IDs of the NFTs to be minted by the msg.sender.
+   */
+  function batchMint(
+    address _to,
+    uint256[] _tokenIds
+  )
+    onlyOwner
+    external
+  {
+    super._batchMint(_to, _tokenIds);
+  }
+
   /**
    * @dev Removes a NFT from owner.
    * @param _owner Address from wich we want to remove the NFT.
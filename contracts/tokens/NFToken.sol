@@ -40,9 +40,9 @@ contract NFToken is
 
   /**
    * @dev Magic value of a smart contract that can recieve NFT.
-   * Equal to: keccak256("onERC721Received(address,uint256,bytes)").
+   * Equal to: keccak256("onERC721Received(address,address,uint256,bytes)").
    */
-  bytes4 constant MAGIC_ON_ERC721_RECEIVED = 0xf0b9e5ba;
+  bytes4 constant MAGIC_ON_ERC721_RECEIVED = 0x150b7a02;
 
   /**
    * @dev Emits when ownership of any NFT changes by any mechanism. This event emits when NFTs are
@@ -109,7 +109,7 @@ contract NFToken is
     address tokenOwner = idToOwner[_tokenId];
     require(
       tokenOwner == msg.sender
-      || getApproved(_tokenId) == msg.sender
+      || idToApprovals[_tokenId] == msg.sender
       || ownerToOperators[tokenOwner][msg.sender]
     );
 
@@ -174,7 +174,7 @@ contract NFToken is
    * approved address for this NFT. Throws if `_from` is not the current owner. Throws if `_to` is
    * the zero address. Throws if `_tokenId` is not a valid NFT. When transfer is complete, this
    * function checks if `_to` is a smart contract (code size > 0). If so, it calls `onERC721Received`
-   * on `_to` and throws if the return value is not `bytes4(keccak256("onERC721Received(address,uint256,bytes)"))`.
+   * on `_to` and throws if the return value is not `bytes4(keccak256("onERC721Received(address,address,uint256,bytes)"))`.
    * @param _from The current owner of the NFT.
    * @param _to The new owner.
    * @param _tokenId The NFT to transfer.
@@ -225,14 +225,32 @@ contract NFToken is
     uint256 _tokenId
   )
     external
-    canTransfer(_tokenId)
-    validNFToken(_tokenId)
   {
-    address tokenOwner = idToOwner[_tokenId];
-    require(tokenOwner == _from);
-    require(_to != address(0));
+    _transferFrom(_from, _to, _tokenId);
+  }
 
-    _transfer(_to, _tokenId);
+  /**
+   * @dev Transfers the ownership of multiple NFTs in a single transaction. Each NFT is subject to
+   * the same checks as in `transferFrom`.
+   * @notice Throws if the given lists are not of the same length. The caller is responsible to
+   * confirm that every `_to` is capable of receiving NFTs or else they maybe be permanently lost.
+   * @param _from List of current owners of the NFTs.
+   * @param _to List of new owners.
+   * @param _tokenIds List of NFTs to transfer.
+   */
+  function batchTransferFrom(
+    address[] _from,
+    address[] _to,
+    uint256[] _tokenIds
+  )
+    external
+  {
+    require(_from.length == _tokenIds.length);
+    require(_to.length == _tokenIds.length);
+
+    for (uint256 i = 0; i < _tokenIds.length; i++) {
+      _transferFrom(_from[i], _to[i], _tokenIds[i]);
+    }
   }
 
   /**
@@ -309,6 +327,32 @@ contract NFToken is
     return ownerToOperators[_owner][_operator];
   }
 
+  /**
+   * @dev Actually perform the transferFrom.
+   * @param _from The current owner of the NFT.
+   * @param _to The new owner.
+   * @param _tokenId The NFT to transfer.
+   */
+  function _transferFrom(
+    address _from,
+    address _to,
+    uint256 _tokenId
+  )
+    internal
+  {
+    require(_to != address(0));
+    address tokenOwner = idToOwner[_tokenId];
+    require(tokenOwner != address(0));
+    require(tokenOwner == _from);
+    require(
+      tokenOwner == msg.sender
+      || idToApprovals[_tokenId] == msg.sender
+      || ownerToOperators[tokenOwner][msg.sender]
+    );
+
+    _transfer(tokenOwner, _to, _tokenId);
+  }
+
   /**
    * @dev Actually perform the safeTransferFrom.
    * @param _from The current owner of the NFT.
@@ -323,40 +367,38 @@ contract NFToken is
     bytes _data
   )
     internal
-    canTransfer(_tokenId)
-    validNFToken(_tokenId)
   {
-    address tokenOwner = idToOwner[_tokenId];
-    require(tokenOwner == _from);
-    require(_to != address(0));
-
-    _transfer(_to, _tokenId);
+    _transferFrom(_from, _to, _tokenId);
 
     if (_to.isContract()) {
-      bytes4 retval = ERC721TokenReceiver(_to).onERC721Received(_from, _tokenId, _data);
+      bytes4 retval = ERC721TokenReceiver(_to).onERC721Received(msg.sender, _from, _tokenId, _data);
       require(retval == MAGIC_ON_ERC721_RECEIVED);
     }
   }
 
   /**
    * @dev Actually preforms the transfer.
-   * @notice Does NO checks.
+   * @notice Does NO checks. Ownership records are left untouched when transferring to the current
+   * owner.
+   * @param _from Address of the current owner, already loaded and verified by the caller.
    * @param _to Address of a new owner.
    * @param _tokenId The NFT that is being transferred.
    */
   function _transfer(
+    address _from,
     address _to,
     uint256 _tokenId
   )
     private
   {
-    address from = idToOwner[_tokenId];
+    clearApproval(_from, _tokenId);
 
-    clearApproval(from, _tokenId);
-    removeNFToken(from, _tokenId);
-    addNFToken(_to, _tokenId);
+    if (_from != _to) {
+      removeNFToken(_from, _tokenId);
+      addNFToken(_to, _tokenId);
+    }
 
-    emit Transfer(from, _to, _tokenId);
+    emit Transfer(_from, _to, _tokenId);
   }
 
   /**
@@ -374,14 +416,39 @@ contract NFToken is
     internal
   {
     require(_to != address(0));
-    require(_tokenId != 0);
-    require(idToOwner[_tokenId] == address(0));
 
     addNFToken(_to, _tokenId);
 
     emit Transfer(address(0), _to, _tokenId);
   }
 
+  /**
+   * @dev Mints multiple new NFTs to the same owner.
+   * @notice This is a private function which should be called from user-implemented external
+   * mint function. The owner's NFT count is updated once for the whole batch instead of once per
+   * NFT.
+   * @notice This function does not call `addNFToken`. Contracts that override `addNFToken` must
+   * also override `_batchMint` to keep their data structures in sync.
+   * @param _to The address that will own the minted NFTs.
+   * @param _tokenIds IDs of the NFTs to be minted by the msg.sender.
+   */
+  function _batchMint(
+    address _to,
+    uint256[] _tokenIds
+  )
+    internal
+  {
+    require(_to != address(0));
+
+    for (uint256 i = 0; i < _tokenIds.length; i++) {
+      require(idToOwner[_tokenIds[i]] == address(0));
+      idToOwner[_tokenIds[i]] = _to;
+      emit Transfer(address(0), _to, _tokenIds[i]);
+    }
+
+    ownerToNFTokenCount[_to] = ownerToNFTokenCount[_to] + _tokenIds.length; // Can not overflow.
+  }
+
   /**
    * @dev Burns a NFT.
    * @notice This is a private function which should be called from user-implemented external
@@ -412,8 +479,11 @@ contract NFToken is
   )
     internal
   {
-    delete idToApprovals[_tokenId];
-    emit Approval(_owner, 0, _tokenId);
+    if (idToApprovals[_tokenId] != address(0)) {
+      delete idToApprovals[_tokenId];
+    }
+
+    emit Approval(_owner, address(0), _tokenId);
   }
 
   /**
@@ -430,13 +500,15 @@ contract NFToken is
   {
     require(idToOwner[_tokenId] == _from);
     assert(ownerToNFTokenCount[_from] > 0);
-    ownerToNFTokenCount[_from] = ownerToNFTokenCount[_from].sub(1);
+    ownerToNFTokenCount[_from] = ownerToNFTokenCount[_from] - 1;
     delete idToOwner[_tokenId];
   }
 
   /**
    * @dev Assignes a new NFT to owner.
    * @notice Use and override this function with caution. Wrong usage can have serious consequences.
+   * `_batchMint` does not call this function, so contracts that override it must also override
+   * `_batchMint`.
    * @param _to Address to wich we want to add the NFT.
    * @param _tokenId Which NFT we want to add.
    */
@@ -449,7 +521,7 @@ contract NFToken is
     require(idToOwner[_tokenId] == address(0));
 
     idToOwner[_tokenId] = _to;
-    ownerToNFTokenCount[_to] = ownerToNFTokenCount[_to].add(1);
+    ownerToNFTokenCount[_to] = ownerToNFTokenCount[_to] + 1; // Can not overflow.
   }
 
 }
@@ -58,6 +58,30 @@ contract NFTokenEnumerable is
     tokens.push(_tokenId);
   }
 
+  /**
+   * @dev Mints multiple new NFTs to the same owner.
+   * @notice This is a private function which should be called from user-implemented external
+   * mint function. Its purpose is to show and properly initialize data structures when using this
+   * implementation.
+   * @param _to The address that will own the minted NFTs.
+   * @param _tokenIds IDs of the NFTs to be minted by the msg.sender.
+   */
+  function _batchMint(
+    address _to,
+    uint256[] _tokenIds
+  )
+    internal
+  {
+    super._batchMint(_to, _tokenIds);
+
+    uint256 length = ownerToIds[_to].length;
+    for (uint256 i = 0; i < _tokenIds.length; i++) {
+      tokens.push(_tokenIds[i]);
+      ownerToIds[_to].push(_tokenIds[i]);
+      idToOwnerIndex[_tokenIds[i]] = length + i;
+    }
+  }
+
   /**
    * @dev Burns a NFT.
    * @notice This is a private function which should be called from user-implemented external
@@ -7,6 +7,7 @@ contract NFTokenReceiverTestMock is
 {
 
   function onERC721Received(
+    address _operator,
     address _from,
     uint256 _tokenId,
     bytes _data
@@ -14,10 +15,11 @@ contract NFTokenReceiverTestMock is
     external
     returns(bytes4)
   {
+    _operator;
     _from;
     _tokenId;
     _data;
-    return 0xf0b9e5ba;
+    return 0x150b7a02;
   }
 
 }
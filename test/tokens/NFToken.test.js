@@ -15,8 +15,10 @@ contract('NFTokenMock', (accounts) => {
   });
 
   it('correctly checks all the supported interfaces', async () => {
+    const erc165Interface = await nftoken.supportsInterface('0x01ffc9a7');
     const nftokenInterface = await nftoken.supportsInterface('0x80ac58cd');
     const nftokenNonExistingInterface = await nftoken.supportsInterface('0x5b5e139f');
+    assert.equal(erc165Interface, true);
     assert.equal(nftokenInterface, true);
     assert.equal(nftokenNonExistingInterface, false);
   });
@@ -32,8 +34,27 @@ contract('NFTokenMock', (accounts) => {
     await assertRevert(nftoken.mint(accounts[0], id2));
   });
 
-  it('throws trying to mint NFT with empty claim', async () => {
-    await assertRevert(nftoken.mint(accounts[0], ''));
+  it('correctly mints NFT with ID 0', async () => {
+    await nftoken.mint(accounts[0], 0);
+    const address = await nftoken.ownerOf(0);
+    assert.equal(address, accounts[0]);
+  });
+
+  it('correctly batch mints NFTs', async () => {
+    const { logs } = await nftoken.batchMint(accounts[1], [id1, id2, id3]);
+    const transferEvents = logs.filter(e => e.event === 'Transfer');
+    assert.equal(transferEvents.length, 3);
+
+    const count = await nftoken.balanceOf(accounts[1]);
+    const ownerOfId3 = await nftoken.ownerOf(id3);
+    assert.equal(count.toNumber(), 3);
+    assert.equal(ownerOfId3, accounts[1]);
+  });
+
+  it('throws when trying to batch mint an already minted NFT', async () => {
+    await nftoken.mint(accounts[0], id2);
+    await assertRevert(nftoken.batchMint(accounts[1], [id1, id2]));
+    await assertRevert(nftoken.batchMint(accounts[1], [id3, id3]));
   });
 
   it('throws when trying to mint NFT to 0x0 address ', async () => {
@@ -68,6 +89,21 @@ contract('NFTokenMock', (accounts) => {
     assert.equal(address, accounts[1]);
   });
 
+  it('correctly approves account as operator', async () => {
+    const owner = accounts[1];
+    const operator = accounts[2];
+    const approved = accounts[3];
+
+    await nftoken.mint(owner, id2);
+    await nftoken.setApprovalForAll(operator, true, {from: owner});
+    const { logs } = await nftoken.approve(approved, id2, {from: operator});
+    const approvalEvent = logs.find(e => e.event === 'Approval');
+    assert.equal(approvalEvent.args._owner, owner);
+
+    const address = await nftoken.getApproved(id2);
+    assert.equal(address, approved);
+  });
+
   it('correctly cancels approval of account[1]', async () => {
     await nftoken.mint(accounts[0], id2);
     await nftoken.approve(accounts[1], id2);
@@ -104,6 +140,19 @@ contract('NFTokenMock', (accounts) => {
     assert.equal(isApprovedForAll, true);
   });
 
+  it('correctly sets an operator without approving other operators', async () => {
+    await nftoken.setApprovalForAll(accounts[6], true);
+    await nftoken.setApprovalForAll(accounts[7], true);
+    await nftoken.setApprovalForAll(accounts[7], false);
+
+    const isApprovedForAll6 = await nftoken.isApprovedForAll(accounts[0], accounts[6]);
+    const isApprovedForAll7 = await nftoken.isApprovedForAll(accounts[0], accounts[7]);
+    const isApprovedForAll8 = await nftoken.isApprovedForAll(accounts[0], accounts[8]);
+    assert.equal(isApprovedForAll6, true);
+    assert.equal(isApprovedForAll7, false);
+    assert.equal(isApprovedForAll8, false);
+  });
+
   it('correctly sets then cancels an operator', async () => {
     await nftoken.mint(accounts[0], id2);
     await nftoken.setApprovalForAll(accounts[6], true);
@@ -199,6 +248,80 @@ contract('NFTokenMock', (accounts) => {
     await assertRevert(nftoken.transferFrom(owner, recipient, id3, {from: owner}));
   });
 
+  it('corectly transfers NFT to its current owner', async () => {
+    const owner = accounts[1];
+    const approved = accounts[2];
+
+    await nftoken.mint(owner, id2);
+    await nftoken.approve(approved, id2, {from: owner});
+    const { logs } = await nftoken.transferFrom(owner, owner, id2, {from: owner});
+    const transferEvent = logs.find(e => e.event === 'Transfer');
+    assert.notEqual(transferEvent, undefined);
+
+    const ownerBalance = await nftoken.balanceOf(owner);
+    const ownerOfId2 = await nftoken.ownerOf(id2);
+    const approvedOfId2 = await nftoken.getApproved(id2);
+
+    assert.equal(ownerBalance, 1);
+    assert.equal(ownerOfId2, owner);
+    assert.equal(approvedOfId2, 0);
+  });
+
+  it('corectly batch transfers NFTs', async () => {
+    const owner = accounts[1];
+    const operator = accounts[2];
+    const recipient1 = accounts[3];
+    const recipient2 = accounts[4];
+
+    await nftoken.mint(owner, id1);
+    await nftoken.mint(owner, id2);
+    await nftoken.mint(operator, id3);
+    await nftoken.setApprovalForAll(operator, true, {from: owner});
+    const { logs } = await nftoken.batchTransferFrom(
+      [owner, owner, operator],
+      [recipient1, recipient2, recipient2],
+      [id1, id2, id3],
+      {from: operator}
+    );
+    const transferEvents = logs.filter(e => e.event === 'Transfer');
+    assert.equal(transferEvents.length, 3);
+
+    const ownerBalance = await nftoken.balanceOf(owner);
+    const operatorBalance = await nftoken.balanceOf(operator);
+    const recipient1Balance = await nftoken.balanceOf(recipient1);
+    const recipient2Balance = await nftoken.balanceOf(recipient2);
+    const ownerOfId1 = await nftoken.ownerOf(id1);
+    const ownerOfId3 = await nftoken.ownerOf(id3);
+
+    assert.equal(ownerBalance, 0);
+    assert.equal(operatorBalance, 0);
+    assert.equal(recipient1Balance, 1);
+    assert.equal(recipient2Balance, 2);
+    assert.equal(ownerOfId1, recipient1);
+    assert.equal(ownerOfId3, recipient2);
+  });
+
+  it('throws when trying to batch transfer with lists of different length', async () => {
+    const owner = accounts[1];
+    const recipient = accounts[2];
+
+    await nftoken.mint(owner, id1);
+    await nftoken.mint(owner, id2);
+    await assertRevert(nftoken.batchTransferFrom([owner, owner], [recipient], [id1, id2], {from: owner}));
+  });
+
+  it('throws when trying to batch transfer NFTs where one is not transferable by sender', async () => {
+    const owner = accounts[1];
+    const recipient = accounts[2];
+
+    await nftoken.mint(owner, id1);
+    await nftoken.mint(recipient, id2);
+    await assertRevert(nftoken.batchTransferFrom([owner, recipient], [recipient, owner], [id1, id2], {from: owner}));
+
+    const ownerOfId1 = await nftoken.ownerOf(id1);
+    assert.equal(ownerOfId1, owner);
+  });
+
   it('corectly safe transfers NFT from owner', async () => {
     const sender = accounts[1];
     const recipient = accounts[2];
@@ -30,6 +30,30 @@ contract('NFTokenEnumerableMock', (accounts) => {
     assert.equal(owner, accounts[1]);
   });
 
+  it('correctly batch mints NFTs', async () => {
+    await nftoken.mint(accounts[1], id1);
+    await nftoken.batchMint(accounts[1], [id2, id3]);
+
+    const totalSupply = await nftoken.totalSupply();
+    const tokenId = await nftoken.tokenByIndex(2);
+    const ownerTokenId = await nftoken.tokenOfOwnerByIndex(accounts[1], 2);
+    const count = await nftoken.balanceOf(accounts[1]);
+    assert.equal(totalSupply, 3);
+    assert.equal(tokenId, id3);
+    assert.equal(ownerTokenId, id3);
+    assert.equal(count.toNumber(), 3);
+
+    await nftoken.transferFrom(accounts[1], accounts[2], id2, {from: accounts[1]});
+
+    const owner1TokenId0 = await nftoken.tokenOfOwnerByIndex(accounts[1], 0);
+    const owner1TokenId1 = await nftoken.tokenOfOwnerByIndex(accounts[1], 1);
+    const owner2TokenId0 = await nftoken.tokenOfOwnerByIndex(accounts[2], 0);
+    assert.equal(owner1TokenId0, id1);
+    assert.equal(owner1TokenId1, id3);
+    assert.equal(owner2TokenId0, id2);
+    await assertRevert(nftoken.tokenOfOwnerByIndex(accounts[1], 2));
+  });
+
   it('returns the correct total supply', async () => {
     const totalSupply0 = await nftoken.totalSupply();
     assert.equal(totalSupply0, 0);